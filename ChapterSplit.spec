@@ -5,7 +5,7 @@ a = Analysis(
     ['gui_split.py'],
     pathex=[],
     binaries=[],
-    datas=[('split-tube-icon.PNG', '.')],
+    datas=[('split-tube-icon.PNG', '.'), ('app.qss', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
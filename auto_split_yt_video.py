@@ -1,49 +1,68 @@
 import json
+import os
 import subprocess
-import re
 from pathlib import Path
 import sys
+import time
+from split_common import (
+    VIDEO_EXTS, VIDEO_ID_RE, SPLIT_BATCH, clean_filename, ytdlp_filename,
+    build_split_cmd, chapters_contiguous, run_ffmpeg, split_segments
+)
 
-VIDEO_EXTS = [".mp4", ".mkv", ".webm"]
 OUTPUT_DIR = "chapters"
 
+# Metadata cache, keyed by YouTube video ID
+CACHE_DIR = Path(".cache")
+CACHE_TTL = 24 * 3600  # seconds
+
 Path(OUTPUT_DIR).mkdir(exist_ok=True)
 
-def clean_filename(text):
-    text = re.sub(r'[\\/:*?"<>|]', '', text)
-    return text.strip().replace(' ', '_')
+def find_video():
+    # First video file in the current directory (one scandir pass, no per-file Path objects)
+    with os.scandir(".") as it:
+        return next((Path(e.name) for e in it if os.path.splitext(e.name)[1].lower() in VIDEO_EXTS and e.is_file()), None)
 
 # URL input
 url = input("🔗 Enter YouTube video URL: ").strip()
 if not url:
     sys.exit("❌ No URL provided")
 
-# Handle metadata (skip download if info.json exists)
-info_json = next(Path(".").glob("*.info.json"), None)
-if not info_json:
+format_id = "bestvideo[height<=1080]+bestaudio/best[height<=1080]"
+
+# Handle metadata (reuse the cached info.json for this video if it is recent)
+vid_match = VIDEO_ID_RE.search(url)
+info_json = CACHE_DIR / f"{vid_match.group(1)}.chapters.json" if vid_match else None
+
+if info_json and info_json.exists() and time.time() - info_json.stat().st_mtime < CACHE_TTL:
+    print(f"♻️ Using cached metadata: {info_json}")
+    with open(info_json, "r", encoding="utf-8") as f:
+        data = json.load(f)
+else:
     print("📄 Downloading metadata...")
-    subprocess.run(
-        ["yt-dlp", "--skip-download", "--write-info-json", url],
-        check=True
+    # Only the fields used below: a few KB instead of the full multi-MB info.json.
+    # Same -f as the download, so "ext" is the container the download will produce.
+    result = subprocess.run(
+        ["yt-dlp", "--skip-download", "--no-playlist", "-f", format_id,
+         "--print", "%(.{id,title,ext,duration,chapters})j", url],
+        capture_output=True, text=True, check=True, encoding='utf-8'
     )
-    info_json = next(Path(".").glob("*.info.json"), None)
-else:
-    print(f"♻️ Using existing metadata: {info_json.name}")
-
-if not info_json:
-    sys.exit("❌ info.json not found")
+    data = json.loads(result.stdout)
+    CACHE_DIR.mkdir(exist_ok=True)
+    info_json = CACHE_DIR / f"{data['id']}.chapters.json"
+    # Keep chapters added to an earlier copy by hand when the video has none
+    if not data.get("chapters") and info_json.exists():
+        with open(info_json, "r", encoding="utf-8") as f:
+            data["chapters"] = json.load(f).get("chapters")
+    info_json.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
 
 # Determine expected filename
-format_id = "bestvideo[height<=1080]+bestaudio/best[height<=1080]"
-get_name_cmd = ["yt-dlp", "--get-filename", "-f", format_id, "-o", "%(title)s.%(ext)s", url]
-name_result = subprocess.run(get_name_cmd, capture_output=True, text=True, check=True, encoding='utf-8')
-expected_video_file = name_result.stdout.strip()
+expected_video_file = ytdlp_filename(data["title"], data.get("ext", "mp4"))
 
 video = Path(expected_video_file) if expected_video_file and Path(expected_video_file).exists() else None
 
 if not video:
     # Fallback search
-    video = next((f for f in Path(".").iterdir() if f.suffix.lower() in VIDEO_EXTS), None)
+    video = find_video()
 
 if not video:
     choice = input("❌ Video file not found. Download it now? (y/n): ").strip().lower()
@@ -55,7 +74,7 @@ if not video:
             "-o", "%(title)s.%(ext)s",
             url
         ], check=True)
-        video = Path(expected_video_file) if Path(expected_video_file).exists() else next((f for f in Path(".").iterdir() if f.suffix.lower() in VIDEO_EXTS), None)
+        video = Path(expected_video_file) if Path(expected_video_file).exists() else find_video()
         if not video:
             sys.exit("❌ Video file still not found after download attempt.")
     else:
@@ -65,16 +84,13 @@ video_ext = video.suffix
 
 print(f"🎬 Video: {video.name}")
 
-with open(info_json, "r", encoding="utf-8") as f:
-    data = json.load(f)
-
 chapters = data.get("chapters")
 duration = data.get("duration")
 
 if not chapters:
-    print(f"⚠️ No chapters found in {info_json.name}")
+    print(f"⚠️ No chapters found in {info_json}")
     print("💡 You can manually add chapters to the JSON file and run this script again.")
-    print("Chapter format example in info.json:")
+    print("Chapter format example in the JSON file:")
     print(' "chapters": [{"start_time": 0, "title": "Intro"}, {"start_time": 120, "title": "Main Part"}]')
     sys.exit(1)
 
@@ -82,34 +98,32 @@ if not duration:
     sys.exit("❌ Duration missing in metadata")
 
 # Split (RE-ENCODE = CORRECT)
-for i, ch in enumerate(chapters):
-    start = ch["start_time"]
-
-    if i + 1 < len(chapters):
-        end = chapters[i + 1]["start_time"]
-    else:
-        end = duration
+# Each chapter ends where the next one starts, the last one at the end of the video
+starts = [ch["start_time"] for ch in chapters]
+ends = starts[1:] + [duration]
 
+parts = []
+for i, (ch, start, end) in enumerate(zip(chapters, starts, ends)):
     length = end - start
 
     title = clean_filename(ch["title"])
     output = Path(OUTPUT_DIR) / f"{i+1:02d}_{title}{video_ext}"
-
-    cmd = [
-        "ffmpeg",
-        "-y",
-        "-ss", str(start),
-        "-i", str(video),
-        "-t", str(length),
-        "-map", "0:v:0",
-        "-map", "0:a?",
-        "-c", "copy",
-        "-avoid_negative_ts", "make_zero",
-        "-movflags", "+faststart",
-        str(output)
-    ]
-
+    parts.append((start, length, output))
     print(f"▶ {output.name}")
-    subprocess.run(cmd)
+
+# Contiguous chapters: one read of the video writes them all
+single_pass = len(parts) > 1 and chapters_contiguous(parts)
+try:
+    if single_pass:
+        try:
+            split_segments(video, parts)
+        except Exception as e:
+            print(f"⚠️ Single-pass split failed ({e}), cutting chapters separately")
+            single_pass = False
+    if not single_pass:
+        for n in range(0, len(parts), SPLIT_BATCH):
+            run_ffmpeg(build_split_cmd(video, parts[n:n + SPLIT_BATCH]))
+except Exception as e:
+    sys.exit(f"❌ {e}")
 
 print("✅ Chapters split correctly with perfect quality.")
@@ -3,16 +3,29 @@ import json
 import subprocess
 import re
 import os
-import urllib.request
+import threading
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QPushButton, QLabel, QTableWidget, QTableWidgetItem,
+    QLineEdit, QPushButton, QLabel, QTableView,
     QHeaderView, QComboBox, QProgressBar, QTextEdit, QFrame, QAbstractItemView,
     QSizePolicy, QFileDialog
 )
-from PySide6.QtCore import Qt, QThread, Signal, Slot
-from PySide6.QtGui import QFont, QIcon, QColor, QPalette, QPixmap
+from PySide6.QtCore import (
+    Qt, QThread, QObject, QRunnable, QThreadPool, QTimer, Signal, Slot,
+    QAbstractTableModel, QModelIndex, QUrl, QFile
+)
+from PySide6.QtGui import QFont, QIcon, QColor, QPalette, QPixmap, QImage, QTextCursor
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from split_common import (
+    VIDEO_EXTS, VIDEO_ID_RE, SPLIT_BATCH, clean_filename, ytdlp_filename,
+    build_split_cmd, chapters_contiguous, run_ffmpeg, split_segments
+)
 
 # --- Portable Path Handling ---
 def get_app_dir():
@@ -36,443 +49,450 @@ def resource_path(relative_path):
 
 def format_seconds(secs):
     """Convert seconds to HH:MM:SS format."""
-    hrs = int(secs // 3600)
-    mins = int((secs % 3600) // 60)
-    secs = int(secs % 60)
+    mins, secs = divmod(int(secs), 60)
+    hrs, mins = divmod(mins, 60)
     return f"{hrs:02d}:{mins:02d}:{secs:02d}"
 
+@lru_cache(maxsize=512)
 def parse_time(time_str):
     """Convert HH:MM:SS or MM:SS or seconds string to float seconds."""
     if not time_str: return 0.0
+    if not isinstance(time_str, str):
+        return float(time_str)
+    match = TIME_RE.fullmatch(time_str)
+    if match:
+        hrs, mins, secs = match.groups()
+        return (int(hrs or 0) * 3600 + int(mins or 0) * 60) + float(secs)
+    # Anything else float() accepts (e.g. "1e3"), or 0
     try:
-        parts = str(time_str).strip().split(':')
-        if len(parts) == 3:
-            return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-        elif len(parts) == 2:
-            return float(parts[0]) * 60 + float(parts[1])
         return float(time_str)
     except ValueError:
         return 0.0
 
+def env_int(name, default):
+    """Positive integer from environment variable name, or default."""
+    try:
+        return max(1, int(os.environ[name]))
+    except (KeyError, ValueError):
+        return default
+
 # --- Configuration ---
-VIDEO_EXTS = [".mp4", ".mkv", ".webm"]
 OUTPUT_DIR = os.path.join(APP_DIR, "chapters")
 
+# Metadata cache, keyed by YouTube video ID
+CACHE_DIR = os.path.join(APP_DIR, ".cache")
+CACHE_TTL = 7 * 24 * 3600  # seconds; "↻" next to Analyze forces a refetch
+# How long a cached info.json can stand in for the URL when downloading.
+# The stream URLs inside it expire after a few hours.
+STREAM_URL_TTL = 3600  # seconds
+
+# yt-dlp prints download progress in this shape: the prefix, then a JSON
+# array of the percent and ETA strings, e.g. [progress] ["  1.2%", "00:03"]
+PROGRESS_PREFIX = "[progress] "
+# Plain fields: an unknown ETA renders as a bare NA, which isn't valid JSON
+PROGRESS_TEMPLATE = "download:" + PROGRESS_PREFIX + "%(progress._percent_str)s|%(progress._eta_str)s"
+
+# Patterns used in loops, compiled once
+# Chapter .txt line: "HH:MM:SS Title" or "MM:SS Title" or "S+ Title"
+CHAPTER_LINE_RE = re.compile(r"^(\d{1,2}:?\d{0,2}:?\d{0,2})\s+(.*)$")
+NON_WORD_RE = re.compile(r'[^\w]')
+# Table/edit time: [[H:]M:]S[.fff], surrounding spaces allowed
+TIME_RE = re.compile(r'\s*(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d*)?)\s*')
+
+def cache_path(url):
+    """Path of the cached info.json for a YouTube URL, or None if no video ID."""
+    match = VIDEO_ID_RE.search(url)
+    return os.path.join(CACHE_DIR, f"{match.group(1)}.info.json") if match else None
+
+# ffmpeg processes run at the same time while splitting. Stream copy is
+# disk-bound, so a handful is enough to keep the drive busy.
+# Override with the CHAPTERSPLIT_JOBS environment variable.
+SPLIT_JOBS = env_int("CHAPTERSPLIT_JOBS", min(4, os.cpu_count() or 1))
+
+# Threads in the Qt pool running metadata, processing and thumbnail jobs.
+# Override with the CHAPTERSPLIT_THREADS environment variable.
+POOL_THREADS = env_int("CHAPTERSPLIT_THREADS", QThread.idealThreadCount())
+
+@lru_cache(maxsize=256)
+def clean_name(name):
+    """Lowercased file stem with symbols stripped, for fuzzy filename matching."""
+    if not name: return ""
+    # Strip symbols but KEEP letters (Unicode), numbers, and underscores
+    # (\w is Unicode-aware by default in py3)
+    return NON_WORD_RE.sub('', Path(name).stem).lower()
+
 # --- Styling (QSS) - YouTube ChapterSplit Theme ---
-STYLE_SHEET = """
-/* ===== Base Styles ===== */
-QMainWindow {
-    background-color: #0f0f0f;
-}
-
-QWidget {
-    color: #ffffff;
-    font-family: 'Inter', 'Segoe UI', sans-serif;
-    font-size: 13px;
-}
-
-/* ===== Glass Panels ===== */
-QFrame#GlassPanel {
-    background-color: rgba(255, 255, 255, 0.03);
-    border-radius: 16px;
-    border: 1px solid rgba(255, 255, 255, 0.1);
-}
-
-QFrame#HeaderPanel {
-    background-color: rgba(0, 0, 0, 0.5);
-    border-radius: 0px;
-    border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-}
-
-/* ===== Inputs ===== */
-QLineEdit {
-    background-color: rgba(0, 0, 0, 0.4);
-    border: 1px solid rgba(255, 255, 255, 0.1);
-    border-radius: 12px;
-    padding: 12px 16px;
-    font-size: 14px;
-    color: #ffffff;
-    selection-background-color: #ff0000;
-}
-
-QLineEdit:focus {
-    border: 1px solid rgba(255, 0, 0, 0.5);
-}
-
-QLineEdit::placeholder {
-    color: #6b7280;
-}
-
-QLineEdit:disabled {
-    background-color: rgba(0, 0, 0, 0.2);
-    color: #4b5563;
-}
-
-/* ===== Primary Button (Red Gradient) ===== */
-QPushButton {
-    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1, stop:0 #ff0000, stop:1 #cc0000);
-    color: white;
-    border: none;
-    border-radius: 12px;
-    padding: 12px 24px;
-    font-weight: 600;
-    font-size: 14px;
-}
-
-QPushButton:hover {
-    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1, stop:0 #ff3333, stop:1 #dd0000);
-}
-
-QPushButton:pressed {
-    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1, stop:0 #cc0000, stop:1 #aa0000);
-}
-
-QPushButton:disabled {
-    background-color: #333333;
-    color: #666666;
-}
-
-/* ===== Secondary Buttons ===== */
-QPushButton#SecondaryBtn {
-    background-color: rgba(255, 255, 255, 0.05);
-    border: 1px solid rgba(255, 255, 255, 0.1);
-    color: #9ca3af;
-    padding: 8px 16px;
-    font-weight: 500;
-}
-
-QPushButton#SecondaryBtn:hover {
-    background-color: rgba(255, 255, 255, 0.1);
-    color: #ffffff;
-}
-
-/* ===== Download/Start Button ===== */
-QPushButton#DownloadBtn {
-    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1, stop:0 #ff0000, stop:1 #cc0000);
-    font-size: 15px;
-    font-weight: bold;
-    padding: 14px 32px;
-}
-
-QPushButton#DownloadBtn:hover {
-    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1, stop:0 #ff3333, stop:1 #dd0000);
-}
-
-QPushButton#DownloadBtn:disabled {
-    background-color: #333333;
-    color: #555555;
-}
-
-/* ===== ComboBox ===== */
-QComboBox {
-    background-color: rgba(26, 26, 26, 1);
-    border: 1px solid rgba(255, 255, 255, 0.1);
-    border-radius: 10px;
-    padding: 10px 14px;
-    font-size: 13px;
-    color: #ffffff;
-    min-width: 200px;
-}
-
-QComboBox:hover {
-    border-color: rgba(255, 0, 0, 0.5);
-}
-
-QComboBox::drop-down {
-    border: none;
-    width: 30px;
-}
-
-QComboBox QAbstractItemView {
-    background-color: #1a1a1a;
-    border: 1px solid rgba(255, 255, 255, 0.1);
-    selection-background-color: #ff0000;
-    color: #ffffff;
-}
-
-/* ===== Table (Chapters) ===== */
-QTableWidget {
-    background-color: transparent;
-    gridline-color: rgba(255, 255, 255, 0.05);
-    border: none;
-    border-radius: 12px;
-    font-size: 13px;
-    alternate-background-color: rgba(255, 255, 255, 0.02);
-    outline: none; /* Removes the "line through" / dashed focus rect */
-}
-
-QTableWidget::item {
-    padding: 0px 12px; /* Horizontal padding only */
-    border-bottom: 1px solid rgba(255, 255, 255, 0.05);
-}
-
-QTableWidget::item:selected {
-    background-color: rgba(0, 0, 0, 0.1);
-    color: #ffffff;
-}
-
-QTableWidget::item:hover {
-    background-color: rgba(255, 255, 255, 0.05);
-}
-
-/* Style the editor (simple input look) */
-QTableWidget QLineEdit, 
-QAbstractItemView QLineEdit {
-    background-color: #1a1a1a;
-    background: #1a1a1a;
-    border: 1px solid #ff0000;
-    border-radius: 4px;
-    padding: 0px 8px;
-    margin: 4px;
-    color: #ffffff;
-    selection-background-color: #ff0000;
-    selection-color: #ffffff;
-    font-size: 13px;
-    min-height: 28px;
-}
-
-QHeaderView::section {
-    background-color: rgba(255, 255, 255, 0.03);
-    color: #9ca3af;
-    padding: 12px;
-    border: none;
-    font-weight: 500;
-    font-size: 12px;
-}
-
-/* ===== Progress Bar ===== */
-QProgressBar {
-    background-color: rgba(255, 255, 255, 0.1);
-    border-radius: 4px;
-    text-align: center;
-    font-weight: bold;
-    color: #ffffff;
-    min-height: 8px;
-    max-height: 8px;
-}
-
-QProgressBar::chunk {
-    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 #dc2626, stop:1 #f87171);
-    border-radius: 4px;
-}
-
-/* ===== Log Area ===== */
-QTextEdit#LogArea {
-    background-color: rgba(0, 0, 0, 0.3);
-    border: 1px solid rgba(255, 255, 255, 0.05);
-    border-radius: 12px;
-    font-family: 'Cascadia Code', 'Consolas', monospace;
-    font-size: 11px;
-    color: #6b7280;
-    padding: 12px;
-}
-
-/* ===== Labels ===== */
-QLabel#TitleLabel {
-    font-size: 24px;
-    font-weight: bold;
-    color: #ff0000;
-}
-
-QLabel#GradientTitle {
-    font-size: 24px;
-    font-weight: bold;
-    color: #ff6b6b;
-}
-
-QLabel#SubtitleLabel {
-    font-size: 12px;
-    color: #9ca3af;
-    font-weight: 400;
-}
-
-QLabel#SectionLabel {
-    font-size: 12px;
-    color: #6b7280;
-    font-weight: 500;
-}
-
-QLabel#VideoTitleLabel {
-    font-size: 18px;
-    font-weight: bold;
-    color: #ffffff;
-}
-
-QLabel#VideoInfoLabel {
-    font-size: 13px;
-    color: #9ca3af;
-}
-
-QLabel#ChapterCountBadge {
-    font-size: 11px;
-    color: #ffffff;
-    background-color: rgba(255, 255, 255, 0.1);
-    padding: 2px 8px;
-    border-radius: 10px;
-}
-
-/* ===== Scrollbar ===== */
-QScrollBar:vertical {
-    background-color: rgba(255, 255, 255, 0.05);
-    width: 8px;
-    border-radius: 4px;
-}
-
-QScrollBar::handle:vertical {
-    background-color: rgba(255, 255, 255, 0.2);
-    border-radius: 4px;
-    min-height: 30px;
-}
-
-QScrollBar::handle:vertical:hover {
-    background-color: rgba(255, 255, 255, 0.3);
-}
-
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-    height: 0px;
-}
-"""
+def load_style_sheet():
+    """The app stylesheet (app.qss, bundled next to the icon), or "" if missing."""
+    qss = QFile(resource_path("app.qss"))
+    if not qss.open(QFile.ReadOnly | QFile.Text):
+        return ""
+    try:
+        return bytes(qss.readAll()).decode('utf-8')
+    finally:
+        qss.close()
+
+# --- Chapter Model ---
+
+class ChapterModel(QAbstractTableModel):
+    """Chapters as parallel title/start/end columns; times are formatted only for display.
+
+    Start and end times are packed float arrays, so totals and the worker's
+    chapter list read plain numbers with no per-row objects or parsing.
+    """
+    HEADERS = ("Chapter Title", "Start", "End")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.titles = []
+        self.starts = array('d')
+        self.ends = array('d')
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.titles)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        row, col = index.row(), index.column()
+        if col == 0:
+            return self.titles[row]
+        return format_seconds(self.starts[row] if col == 1 else self.ends[row])
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole:
+            return False
+        row, col = index.row(), index.column()
+        if col == 0:
+            self.titles[row] = str(value)
+        elif col == 1:
+            self.starts[row] = parse_time(value)
+        else:
+            self.ends[row] = parse_time(value)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def load(self, rows):
+        """Replace all chapters with (title, start, end) rows."""
+        self.beginResetModel()
+        self.titles = [str(title) for title, _, _ in rows]
+        self.starts = array('d', [start for _, start, _ in rows])
+        self.ends = array('d', [end for _, _, end in rows])
+        self.endResetModel()
+
+    def append(self, title, start, end):
+        row = len(self.titles)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.titles.append(str(title))
+        self.starts.append(float(start))
+        self.ends.append(float(end))
+        self.endInsertRows()
+
+    def remove(self, rows):
+        # One removal per contiguous run, bottom-up, so listeners (the stats
+        # label) refresh once per selected block rather than once per row
+        # Ascending, so the highest row comes off the end in O(1)
+        rows = sorted(set(rows))
+        while rows:
+            last = first = rows.pop()
+            while rows and rows[-1] == first - 1:
+                first = rows.pop()
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.titles[first:last + 1], self.starts[first:last + 1], self.ends[first:last + 1]
+            self.endRemoveRows()
 
 # --- Worker Threads ---
 
-class MetadataWorker(QThread):
+class ThumbnailSignals(QObject):
+    decoded = Signal(QImage)
+
+
+class ThumbnailDecoder(QRunnable):
+    """Decode and downscale thumbnail bytes on a pool thread.
+
+    QImage (unlike QPixmap) is safe off the GUI thread, so the smooth
+    resample happens here and the GUI only wraps the result in a pixmap.
+    """
+
+    def __init__(self, data, signals):
+        super().__init__()
+        self.data = data
+        self.signals = signals
+
+    def run(self):
+        image = QImage.fromData(self.data)
+        if not image.isNull():
+            image = image.scaled(320, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.signals.decoded.emit(image)
+
+
+class MetadataSignals(QObject):
     finished = Signal(dict)
     error = Signal(str)
 
+
+class MetadataWorker(QRunnable):
     def __init__(self, url):
         super().__init__()
+        # The window keeps a reference; don't let the pool delete us under it
+        self.setAutoDelete(False)
+        self.signals = MetadataSignals()
         self.url = url
 
     def run(self):
         try:
-            # Fetch formats and metadata
-            cmd = ["yt-dlp", "--dump-json", "--skip-download", self.url]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
-            data = json.loads(result.stdout)
-            self.finished.emit(data)
+            # Reuse cached metadata for this video if it is recent
+            cache_file = cache_path(self.url)
+            if cache_file and os.path.exists(cache_file) and time.time() - os.path.getmtime(cache_file) < CACHE_TTL:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    self.signals.finished.emit(json.load(f))
+                return
+
+            # Fetch formats and metadata. --no-playlist keeps watch?v=...&list=...
+            # URLs from expanding (and dumping) the whole playlist.
+            # Output stays raw bytes: the cache gets exactly what yt-dlp printed,
+            # with no re-encoding, and stderr is kept for yt-dlp's own error text.
+            # (json.loads still decodes the bytes to a str internally.)
+            cmd = ["yt-dlp", "--dump-json", "--skip-download", "--no-playlist", self.url]
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            raw, err = process.communicate()
+            if process.returncode != 0:
+                raise Exception(err.decode('utf-8', errors='replace').strip() or f"yt-dlp failed with code {process.returncode}")
+            data = json.loads(raw)
+
+            Path(CACHE_DIR).mkdir(exist_ok=True)
+            # Write then rename, so a crash never leaves a truncated cache entry
+            cache_file = os.path.join(CACHE_DIR, f"{data['id']}.info.json")
+            with open(cache_file + ".tmp", 'wb') as f:
+                f.write(raw)
+            os.replace(cache_file + ".tmp", cache_file)
+            self.signals.finished.emit(data)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
-class ProcessWorker(QThread):
+class ProcessSignals(QObject):
     progress = Signal(int, str)
     download_progress = Signal(str, str)  # (percent, eta)
     finished = Signal()
     error = Signal(str)
 
-    def __init__(self, url, format_id, chapters, video_filename=None):
+
+class ProcessWorker(QRunnable):
+    def __init__(self, url, format_id, chapters, video_data=None):
         super().__init__()
+        self.setAutoDelete(False)
+        self.signals = ProcessSignals()
         self.url = url
         self.format_id = format_id
         self.chapters = chapters
-        self.video_filename = video_filename
+        self.video_data = video_data
 
     def find_video_file(self, expected_name=None, title_hint=None):
         """Ultra-robust fuzzy file discovery (Unicode-aware)."""
         # 1. Try exact match first
-        if expected_name and Path(expected_name).exists():
+        if expected_name and os.path.exists(expected_name):
             return str(expected_name)
         
         # 2. Try alphanumeric/Unicode fuzzy match
-        # \w matches word characters including Unicode if supported by re.LOCALE or re.UNICODE (default in py3)
-        def clean_name(name):
-            if not name: return ""
-            # Strip symbols but KEEP letters (Unicode), numbers, and underscores
-            cleaned = re.sub(r'[^\w]', '', Path(name).stem).lower()
-            return cleaned
-
         target_base = clean_name(expected_name)
         hint_base = clean_name(title_hint) if title_hint else ""
 
-        # Scan folder for candidates
+        # Scan folder for candidates in one pass: extension check first (no syscall),
+        # then is_file/stat from the DirEntry, keeping (mtime, name) for the winner pick
         candidates = []
-        for f in Path(".").iterdir():
-            if f.is_file() and f.suffix.lower() in VIDEO_EXTS:
-                f_clean = clean_name(f.name)
-                # Check against predicted name or title hint
-                if target_base and (target_base in f_clean or f_clean in target_base):
-                    candidates.append(f)
-                elif hint_base and (hint_base in f_clean or f_clean in hint_base):
-                    candidates.append(f)
-        
+        with os.scandir(".") as it:
+            for entry in it:
+                if os.path.splitext(entry.name)[1].lower() not in VIDEO_EXTS or not entry.is_file():
+                    continue
+                f_clean = clean_name(entry.name)
+                # Check against predicted name or title hint. A name with no word
+                # characters cleans to "", which is a substring of everything.
+                if not f_clean:
+                    continue
+                if (target_base and (target_base in f_clean or f_clean in target_base)) or \
+                        (hint_base and (hint_base in f_clean or f_clean in hint_base)):
+                    candidates.append((entry.stat().st_mtime, entry.name))
+
         if candidates:
             # Prefer the most recent file if multiple matches found
-            best_match = max(candidates, key=lambda x: x.stat().st_mtime)
-            return str(best_match)
-        
+            return max(candidates)[1]
+
         return None
 
+    def yt_dlp_source(self):
+        """yt-dlp arguments naming the video to process.
+
+        While the info.json cached by MetadataWorker is recent enough for its
+        stream URLs to work, yt-dlp loads it instead of extracting the page again.
+        """
+        info_file = cache_path(self.url)
+        if info_file and os.path.exists(info_file) and time.time() - os.path.getmtime(info_file) < STREAM_URL_TTL:
+            return ["--load-info-json", info_file]
+        return [self.url]
+
+    def download(self, source):
+        """Run the yt-dlp download, forwarding its progress. Returns the exit code."""
+        # Use Popen to capture real-time progress
+        cmd = ["yt-dlp", "--newline", "--progress", "--progress-template", PROGRESS_TEMPLATE,
+               "-f", self.format_id, "-o", "%(title)s.%(ext)s", *source]
+
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, encoding='utf-8', errors='replace', bufsize=1
+        )
+
+        # yt-dlp reports every chunk; forward at most ~10 updates a second
+        # (and only changed ones) so the GUI event queue isn't flooded
+        last_emit = 0.0
+        last_percent = None
+        try:
+            for line in process.stdout:
+                if not line.startswith(PROGRESS_PREFIX):
+                    continue
+                now = time.monotonic()
+                percent, _, eta = line[len(PROGRESS_PREFIX):].partition("|")
+                percent, eta = percent.strip(), eta.strip()
+                if percent == last_percent or (now - last_emit < 0.1 and percent != "100.0%"):
+                    continue
+                last_emit, last_percent = now, percent
+                self.signals.download_progress.emit(percent, f"Remaining: {eta}" if eta not in ("", "NA") else "")
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            process.wait()
+
+        return process.returncode
+
+    def split_parallel(self, video_path, parts):
+        """Cut chapters with seeked multi-output ffmpeg runs on a thread pool."""
+        total = len(parts)
+        size = min(SPLIT_BATCH, -(-total // SPLIT_JOBS))
+        batches = [parts[n:n + size] for n in range(0, total, size)]
+        # Seconds of video each batch covers; progress is a running total of
+        # seconds written, updated under a lock from the pool threads
+        batch_secs = [sum(length for _, length, _ in batch) for batch in batches]
+        total_secs = sum(batch_secs) or 1
+        lock = threading.Lock()
+        written = 0.0
+        done = 0
+        shown = 20
+        stop = threading.Event()
+
+        def advance(secs, chapters=0):
+            nonlocal written, done, shown
+            with lock:
+                written += secs
+                done += chapters
+                percent = int(20 + written/total_secs*80)
+                # Ticks that don't move the bar by a whole percent aren't sent.
+                # Emitted under the lock so the bar never steps backwards.
+                if chapters:
+                    self.signals.progress.emit(percent, f"✂️ Split {done}/{total} chapters")
+                elif percent != shown:
+                    self.signals.progress.emit(percent, "")
+                shown = percent
+
+        def split(n):
+            if stop.is_set():
+                return
+            batch_done = 0.0
+            # With -copyts ffmpeg reports source timestamps, so progress is how
+            # far it has got through the stretch of video the batch spans
+            first = min(start for start, _, _ in batches[n])
+            span = max(start + length for start, length, _ in batches[n]) - first or 1
+
+            def on_time(secs):
+                nonlocal batch_done
+                secs = batch_secs[n] * min(max((secs - first) / span, 0), 1)
+                if secs > batch_done:
+                    advance(secs - batch_done)
+                    batch_done = secs
+
+            run_ffmpeg(build_split_cmd(video_path, batches[n]), on_time)
+            advance(batch_secs[n] - batch_done, len(batches[n]))
+
+        with ThreadPoolExecutor(max_workers=min(SPLIT_JOBS, len(batches))) as pool:
+            futures = [pool.submit(split, n) for n in range(len(batches))]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except Exception:
+                # Let running ffmpeg processes finish, skip the rest
+                stop.set()
+                raise
+
     def run(self):
         try:
             Path(OUTPUT_DIR).mkdir(exist_ok=True)
+            source = self.yt_dlp_source()
             
-            # Helper to get the actual filename yt-dlp would/did use
-            get_name_cmd = ["yt-dlp", "--get-filename", "-f", self.format_id, "-o", "%(title)s.%(ext)s", self.url]
-            name_result = subprocess.run(get_name_cmd, capture_output=True, text=True, check=True, encoding='utf-8', errors='replace')
-            expected_video_file = (name_result.stdout or "").strip()
+            # The filename yt-dlp would/did use, predicted from the fetched metadata
+            expected_video_file = None
+            title_hint = self.video_data.get('title') if self.video_data else None
+            if title_hint:
+                expected_video_file = ytdlp_filename(title_hint, self.video_data.get('ext', 'mp4'))
             
             # 1. Discover existing video
-            title_hint = self.video_filename if self.video_filename else None 
             video_file = self.find_video_file(expected_video_file, title_hint=title_hint)
 
             # 2. Download if not found
             if not video_file or not Path(video_file).exists():
-                self.progress.emit(10, "📥 Downloading video...")
-                
-                # Use Popen to capture real-time progress
-                cmd = ["yt-dlp", "--newline", "--progress", "-f", self.format_id, "-o", "%(title)s.%(ext)s", self.url]
-                # Regex for percentage and ETA: [download]  1.2% of 10.00MiB at  2.41MiB/s ETA 00:03
-                re_progress = re.compile(r"\[download\]\s+([\d\.]+)%\s+of\s+.*\s+at\s+.*\s+ETA\s+([\d:]+)")
+                self.signals.progress.emit(10, "📥 Downloading video...")
                 
-                process = subprocess.Popen(
-                    cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, 
-                    text=True, encoding='utf-8', errors='replace', bufsize=1
-                )
-                
-                for line in process.stdout:
-                    match = re_progress.search(line)
-                    if match:
-                        percent = match.group(1)
-                        eta = match.group(2)
-                        self.download_progress.emit(f"{percent}%", f"Remaining: {eta}")
-                
-                process.wait()
-                if process.returncode != 0:
-                    raise Exception(f"yt-dlp download failed with code {process.returncode}")
+                returncode = self.download(source)
+                if returncode != 0 and source != [self.url]:
+                    # Stream URLs in the cached info.json may have expired
+                    returncode = self.download([self.url])
+                if returncode != 0:
+                    raise Exception(f"yt-dlp download failed with code {returncode}")
                 
                 # Search again after download
                 video_file = self.find_video_file(expected_video_file, title_hint=title_hint)
 
             if not video_file or not Path(video_file).exists():
-                self.error.emit(f"Video file not found: {expected_video_file or 'Unknown'}")
+                self.signals.error.emit(f"Video file not found: {expected_video_file or 'Unknown'}")
                 return
 
             video_path = Path(video_file)
             video_ext = video_path.suffix
-            self.progress.emit(15, f"✅ Using file: {video_path.name}")
+            self.signals.progress.emit(15, f"✅ Using file: {video_path.name}")
 
             # 2. Split into chapters
-            total = len(self.chapters)
+            parts = []
             for i, ch in enumerate(self.chapters):
-                title = ch['title']
-                start = ch['start_time']
-                length = ch['length']
-                
-                clean_title = re.sub(r'[\\/:*?"<>|]', '', title or "Chapter").strip().replace(' ', '_')
+                clean_title = clean_filename(ch['title'] or "Chapter")
                 output = Path(OUTPUT_DIR) / f"{i+1:02d}_{clean_title}{video_ext}"
-                
-                self.progress.emit(int(20 + (i/total)*80), f"✂️ Splitting: {title}")
-                
-                cmd = [
-                    "ffmpeg", "-y", "-ss", str(start), "-i", str(video_path),
-                    "-t", str(length), "-map", "0:v:0", "-map", "0:a?",
-                    "-c", "copy", "-avoid_negative_ts", "make_zero",
-                    "-movflags", "+faststart", str(output)
-                ]
-                subprocess.run(cmd, capture_output=True)
-
-            self.finished.emit()
+                parts.append((ch['start_time'], ch['length'], output))
+
+            self.signals.progress.emit(20, f"✂️ Splitting {len(parts)} chapters...")
+            if len(parts) > 1 and chapters_contiguous(parts):
+                try:
+                    end = parts[-1][0] + parts[-1][1]
+                    split_segments(
+                        video_path, parts,
+                        lambda secs: self.signals.progress.emit(int(20 + min(secs / end, 1)*80), "")
+                    )
+                except Exception as e:
+                    self.signals.progress.emit(20, f"⚠️ Single-pass split failed ({e}), cutting chapters separately")
+                    self.split_parallel(video_path, parts)
+            else:
+                self.split_parallel(video_path, parts)
+
+            self.signals.finished.emit()
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 # --- Main Window ---
 
@@ -485,11 +505,21 @@ class AutoSplitApp(QMainWindow):
             self.setWindowIcon(QIcon(icon_path))
         self.setWindowTitle("ChapterSplit")
         self.resize(1000, 700)
-        self.setStyleSheet(STYLE_SHEET)
         self.video_data = None
+        self.meta_in_flight = False
+        self.process_in_flight = False
+        # Activity log history; older messages are dropped
+        self.log_lines = deque(maxlen=200)
+        self.log_flush_pending = False
         self.setup_ui()
 
     def setup_ui(self):
+        # Async HTTP for thumbnails; replies arrive as signals on the GUI thread
+        self.network = QNetworkAccessManager(self)
+        self.thumbnail_reply = None
+        self.thumbnail_signals = ThumbnailSignals(self)
+        self.thumbnail_signals.decoded.connect(self.on_thumbnail_decoded)
+
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
@@ -546,8 +576,14 @@ class AutoSplitApp(QMainWindow):
         self.fetch_btn.setMinimumHeight(44)
         self.fetch_btn.setMinimumWidth(120)
         self.fetch_btn.clicked.connect(self.fetch_metadata)
+        self.refresh_btn = QPushButton("↻")
+        self.refresh_btn.setObjectName("SecondaryBtn")
+        self.refresh_btn.setMinimumHeight(44)
+        self.refresh_btn.setToolTip("Refresh metadata (ignore the cached copy)")
+        self.refresh_btn.clicked.connect(self.refresh_metadata)
         url_row.addWidget(self.url_input, 1)
         url_row.addWidget(self.fetch_btn)
+        url_row.addWidget(self.refresh_btn)
         url_layout.addLayout(url_row)
 
         hint_label = QLabel("Supports: youtube.com, youtu.be, shorts")
@@ -567,13 +603,6 @@ class AutoSplitApp(QMainWindow):
         self.thumbnail_label = QLabel()
         self.thumbnail_label.setObjectName("ThumbnailLabel")
         self.thumbnail_label.setFixedSize(320, 180)
-        self.thumbnail_label.setStyleSheet("""
-            QLabel#ThumbnailLabel {
-                background-color: #1a1a1a;
-                border-radius: 12px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }
-        """)
         self.thumbnail_label.setAlignment(Qt.AlignCenter)
         self.thumbnail_label.setText("🎬")
         self.thumbnail_label.setScaledContents(False)
@@ -651,8 +680,12 @@ class AutoSplitApp(QMainWindow):
         chapters_layout.addLayout(section_header)
 
         # Table
-        self.chapter_table = QTableWidget(0, 3)
-        self.chapter_table.setHorizontalHeaderLabels(["Chapter Title", "Start", "End"])
+        self.chapter_model = ChapterModel(self)
+        for sig in (self.chapter_model.dataChanged, self.chapter_model.rowsInserted,
+                    self.chapter_model.rowsRemoved, self.chapter_model.modelReset):
+            sig.connect(self.update_table_stats)
+        self.chapter_table = QTableView()
+        self.chapter_table.setModel(self.chapter_model)
         self.chapter_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.chapter_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.chapter_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
@@ -694,9 +727,9 @@ class AutoSplitApp(QMainWindow):
         # Progress Info (Percentage and ETA)
         self.progress_info_layout = QHBoxLayout()
         self.progress_percent_label = QLabel("")
-        self.progress_percent_label.setStyleSheet("color: #ff6b6b; font-weight: bold; font-size: 14px;")
+        self.progress_percent_label.setObjectName("ProgressPercentLabel")
         self.progress_eta_label = QLabel("")
-        self.progress_eta_label.setStyleSheet("color: #9ca3af; font-size: 12px;")
+        self.progress_eta_label.setObjectName("ProgressEtaLabel")
         self.progress_info_layout.addWidget(self.progress_percent_label)
         self.progress_info_layout.addStretch()
         self.progress_info_layout.addWidget(self.progress_eta_label)
@@ -721,46 +754,75 @@ class AutoSplitApp(QMainWindow):
         main_layout.addLayout(columns_layout, 1)
 
     def load_thumbnail(self, url):
-        """Load thumbnail from URL and display it."""
-        try:
-            # Download the thumbnail
-            with urllib.request.urlopen(url, timeout=5) as response:
-                data = response.read()
-            
-            # Create pixmap from data
-            pixmap = QPixmap()
-            pixmap.loadFromData(data)
-            
-            # Scale to fit the label while maintaining aspect ratio
-            scaled = pixmap.scaled(320, 180, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.thumbnail_label.setPixmap(scaled)
-        except Exception as e:
-            self.log(f"⚠️ Could not load thumbnail: {e}")
+        """Start downloading the thumbnail; on_thumbnail_loaded displays it."""
+        request = QNetworkRequest(QUrl(url))
+        request.setTransferTimeout(5000)
+        self.thumbnail_reply = self.network.get(request)
+        reply = self.thumbnail_reply
+        reply.finished.connect(lambda: self.on_thumbnail_loaded(reply))
+
+    def on_thumbnail_loaded(self, reply):
+        reply.deleteLater()
+        if reply is not self.thumbnail_reply:
+            return  # A newer video was analyzed meanwhile
+        if reply.error() != QNetworkReply.NetworkError.NoError:
+            self.log(f"⚠️ Could not load thumbnail: {reply.errorString()}")
             self.thumbnail_label.setText("🎬")
+            return
+        QThreadPool.globalInstance().start(
+            ThumbnailDecoder(bytes(reply.readAll()), self.thumbnail_signals)
+        )
+
+    @Slot(QImage)
+    def on_thumbnail_decoded(self, image):
+        if image.isNull():
+            self.log("⚠️ Could not load thumbnail: unsupported image data")
+            return
+        self.thumbnail_label.setPixmap(QPixmap.fromImage(image))
 
     def log(self, message):
-        self.log_area.append(message)
-        self.log_area.verticalScrollBar().setValue(self.log_area.verticalScrollBar().maximum())
+        self.log_lines.append(message)
+        # Redraw once per event-loop turn, however many messages arrive in it
+        if not self.log_flush_pending:
+            self.log_flush_pending = True
+            QTimer.singleShot(0, self.flush_log)
+
+    def flush_log(self):
+        self.log_flush_pending = False
+        self.log_area.setPlainText("\n".join(self.log_lines))
+        self.log_area.moveCursor(QTextCursor.End)
+
+    def refresh_metadata(self):
+        cache_file = cache_path((self.url_input.text() or "").strip())
+        if cache_file and os.path.exists(cache_file):
+            os.remove(cache_file)
+        self.fetch_metadata()
 
     def fetch_metadata(self):
         url = (self.url_input.text() or "").strip()
         if not url:
             self.log("❌ Enter a URL first")
             return
+        if self.meta_in_flight:
+            return
 
+        self.meta_in_flight = True
         self.fetch_btn.setEnabled(False)
+        self.refresh_btn.setEnabled(False)
         self.fetch_btn.setText("⏳ Analyzing...")
         self.start_btn.setEnabled(False)
         self.log("📡 Analyzing video...")
         
         self.metaworker = MetadataWorker(url)
-        self.metaworker.finished.connect(self.on_metadata_fetched)
-        self.metaworker.error.connect(self.on_error)
-        self.metaworker.start()
+        self.metaworker.signals.finished.connect(self.on_metadata_fetched)
+        self.metaworker.signals.error.connect(self.on_metadata_error)
+        QThreadPool.globalInstance().start(self.metaworker)
 
     def on_metadata_fetched(self, data):
+        self.meta_in_flight = False
         self.video_data = data
         self.fetch_btn.setEnabled(True)
+        self.refresh_btn.setEnabled(True)
         self.fetch_btn.setText("🔍  Analyze")
         self.log("✅ Video analyzed successfully")
 
@@ -778,62 +840,58 @@ class AutoSplitApp(QMainWindow):
         self.video_title_label.setText(title[:60] + "..." if len(title) > 60 else title)
         self.video_info_label.setText(f"👤 {channel}  •  🕐 {duration_str}")
 
-        # Enable Start Button
-        self.start_btn.setEnabled(True)
+        # Enable Start Button, unless a split is still running
+        self.start_btn.setEnabled(not self.process_in_flight)
 
         # Update Qualities
         self.quality_combo.clear()
-        formats = data.get('formats', [])
-        # Filter: bestvideo with height <= 1080. Fallback to best if none.
-        seen_qualities = set()
-        for f in formats:
+        # Filter: video formats with height <= 1080, one entry per (height, ext).
+        # The first listed wins: later duplicates are typically AV1 or HDR
+        # streams, which play in fewer places once stream-copied into chapters.
+        options = {}
+        for f in data.get('formats', ()):
             height = f.get('height')
-            if height and height <= 1080:
-                ext = f.get('ext')
-                vcodec = f.get('vcodec', 'none')
-                acodec = f.get('acodec', 'none')
-                if vcodec != 'none':
-                    label = f"{height}p ({ext}) - {f.get('format_note', '')}"
-                    if label not in seen_qualities:
-                        # Append +bestaudio/best to ensure audio is merged
-                        fmt_id = f['format_id']
-                        if acodec == 'none':
-                            fmt_id += "+bestaudio/best"
-                        self.quality_combo.addItem(label, fmt_id)
-                        seen_qualities.add(label)
+            vcodec = f.get('vcodec')
+            if not height or height > 1080 or vcodec in (None, 'none'):
+                continue
+            ext = f.get('ext')
+            if (height, ext) in options:
+                continue
+            # Append +bestaudio/best to ensure audio is merged
+            fmt_id = f['format_id']
+            if f.get('acodec', 'none') == 'none':
+                fmt_id += "+bestaudio/best"
+            options[height, ext] = (f"{height}p ({ext}) - {f.get('format_note', '')}", fmt_id)
+
+        for label, fmt_id in options.values():
+            self.quality_combo.addItem(label, fmt_id)
         
         self.quality_combo.addItem("Best Available (Auto)", "bestvideo[height<=1080]+bestaudio/best[height<=1080]")
 
         # Update Chapters
-        self.chapter_table.setRowCount(0)
         chapters = data.get('chapters', [])
 
         if chapters:
-            for i, ch in enumerate(chapters):
-                start = ch['start_time']
-                end = chapters[i+1]['start_time'] if i+1 < len(chapters) else duration
-                self.add_row(ch['title'], start, end)
+            starts = [ch['start_time'] for ch in chapters]
+            self.chapter_model.load([
+                (ch['title'], start, end)
+                for ch, start, end in zip(chapters, starts, starts[1:] + [duration])
+            ])
         else:
             self.log("⚠️ No chapters found. Full video will be processed.")
-            self.add_row("Full Video", 0, duration)
+            self.chapter_model.load([("Full Video", 0, duration)])
 
     def add_row(self, title="", start=0, end=0):
-        row = self.chapter_table.rowCount()
-        self.chapter_table.insertRow(row)
-        self.chapter_table.setItem(row, 0, QTableWidgetItem(str(title)))
-        self.chapter_table.setItem(row, 1, QTableWidgetItem(format_seconds(float(start))))
-        self.chapter_table.setItem(row, 2, QTableWidgetItem(format_seconds(float(end))))
-        self.update_table_stats()
+        self.chapter_model.append(title, start, end)
 
     def delete_row(self):
         rows = self.chapter_table.selectionModel().selectedRows()
         if not rows:
             # Fallback for when no rows are selected - remove last
-            self.chapter_table.removeRow(self.chapter_table.rowCount() - 1)
+            if self.chapter_model.rowCount():
+                self.chapter_model.remove([self.chapter_model.rowCount() - 1])
         else:
-            for row in reversed(rows):
-                self.chapter_table.removeRow(row.row())
-        self.update_table_stats()
+            self.chapter_model.remove(index.row() for index in rows)
 
     def import_chapters_from_file(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Open Chapters Text File", "", "Text Files (*.txt);;All Files (*)")
@@ -845,13 +903,11 @@ class AutoSplitApp(QMainWindow):
                 lines = f.readlines()
 
             chapters = []
-            # Regex for "HH:MM:SS Title" or "MM:SS Title" or "S+ Title"
-            re_line = re.compile(r"^(\d{1,2}:?\d{0,2}:?\d{0,2})\s+(.*)$")
             
             for line in lines:
                 line = line.strip()
                 if not line: continue
-                match = re_line.match(line)
+                match = CHAPTER_LINE_RE.match(line)
                 if match:
                     timestamp_str = match.group(1)
                     title = match.group(2)
@@ -864,47 +920,44 @@ class AutoSplitApp(QMainWindow):
                 self.log("⚠️ No valid chapters found in file.")
                 return
 
-            # Clear and populate
-            self.chapter_table.setRowCount(0)
+            # Replace table contents
             duration = self.video_data.get('duration', 0) if self.video_data else 0
 
-            for i, ch in enumerate(chapters):
-                start = ch['start_time']
-                # End is the start of next chapter, or video duration if it's the last one
-                if i + 1 < len(chapters):
-                    end = chapters[i+1]['start_time']
-                else:
-                    end = duration if duration > start else start + 60 # Default +1min if no video loaded
-                
-                self.add_row(ch['title'], start, end)
+            # End is the start of next chapter, or video duration if it's the last one
+            starts = [ch['start_time'] for ch in chapters]
+            last = starts[-1]
+            ends = starts[1:] + [duration if duration > last else last + 60] # Default +1min if no video loaded
+
+            self.chapter_model.load([(ch['title'], start, end) for ch, start, end in zip(chapters, starts, ends)])
 
             self.log(f"✅ Imported {len(chapters)} chapters from file.")
         except Exception as e:
             self.log(f"❌ Error importing chapters: {e}")
 
-    def update_table_stats(self):
-        count = self.chapter_table.rowCount()
+    def update_table_stats(self, *_):
+        count = self.chapter_model.rowCount()
         self.chapter_count_label.setText(str(count))
         
-        total_sec = 0
-        for row in range(count):
-            try:
-                start = parse_time(self.chapter_table.item(row, 1).text())
-                end = parse_time(self.chapter_table.item(row, 2).text())
-                total_sec += (end - start)
-            except:
-                pass
-        
+        total_sec = sum(self.chapter_model.ends) - sum(self.chapter_model.starts)
         dur_str = format_seconds(total_sec)
         self.stats_label.setText(f"{count} {'chapter' if count == 1 else 'chapters'} • {dur_str} total")
 
+    def on_metadata_error(self, msg):
+        self.meta_in_flight = False
+        self.on_error(msg)
+
+    def on_process_error(self, msg):
+        self.process_in_flight = False
+        self.on_error(msg)
+
     def on_error(self, msg):
         self.fetch_btn.setEnabled(True)
+        self.refresh_btn.setEnabled(True)
         self.fetch_btn.setText("🔍  Analyze")
         self.progress_percent_label.setText("")
         self.progress_eta_label.setText("")
-        # Only enable start if we already have video data
-        if self.video_data:
+        # Only enable start if we already have video data and no split is running
+        if self.video_data and not self.process_in_flight:
             self.start_btn.setEnabled(True)
         self.log(f"❌ Error: {msg}")
 
@@ -919,37 +972,37 @@ class AutoSplitApp(QMainWindow):
             self.log("❌ Select a quality first")
             return
 
-        chapters = []
-        for row in range(self.chapter_table.rowCount()):
-            title = self.chapter_table.item(row, 0).text()
-            start = parse_time(self.chapter_table.item(row, 1).text())
-            end = parse_time(self.chapter_table.item(row, 2).text())
-            chapters.append({
-                'title': title,
-                'start_time': start,
-                'length': end - start
-            })
+        model = self.chapter_model
+        chapters = [
+            {'title': title, 'start_time': start, 'length': end - start}
+            for title, start, end in zip(model.titles, model.starts, model.ends)
+        ]
 
         if not chapters:
             self.log("❌ No chapters to split")
             return
+        # One run at a time: a second worker would race on the same output files
+        if self.process_in_flight:
+            self.log("⏳ A split is already running; wait for it to finish")
+            return
 
+        self.process_in_flight = True
         self.start_btn.setEnabled(False)
         self.progress_bar.setValue(0)
-        
-        # Pass the title to the worker as a hint
-        title_hint = self.video_data.get('title', '') if self.video_data else None
 
-        self.worker = ProcessWorker(self.url_input.text().strip(), self.quality_combo.currentData(), chapters, video_filename=title_hint)
-        self.worker.progress.connect(self.on_progress)
-        self.worker.download_progress.connect(self.on_download_progress)
-        self.worker.finished.connect(self.on_finished)
-        self.worker.error.connect(self.on_error)
-        self.worker.start()
+        self.worker = ProcessWorker(url, format_id, chapters, video_data=self.video_data)
+        self.worker.signals.progress.connect(self.on_progress)
+        self.worker.signals.download_progress.connect(self.on_download_progress)
+        self.worker.signals.finished.connect(self.on_finished)
+        self.worker.signals.error.connect(self.on_process_error)
+        QThreadPool.globalInstance().start(self.worker)
 
     def on_progress(self, val, msg):
+        if msg:
+            self.log(msg)
+        if val == self.progress_bar.value():
+            return
         self.progress_bar.setValue(val)
-        self.log(msg)
         # Clear download info if we moved past download
         if val > 15:
             self.progress_percent_label.setText("")
@@ -960,8 +1013,10 @@ class AutoSplitApp(QMainWindow):
         self.progress_eta_label.setText(eta)
 
     def on_finished(self):
+        self.process_in_flight = False
         self.start_btn.setEnabled(True)
         self.fetch_btn.setEnabled(True)
+        self.refresh_btn.setEnabled(True)
         self.progress_bar.setValue(100)
         self.progress_percent_label.setText("")
         self.progress_eta_label.setText("")
@@ -969,6 +1024,9 @@ class AutoSplitApp(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    # One stylesheet for the whole app, parsed once; widgets pick rules by objectName
+    app.setStyleSheet(load_style_sheet())
+    QThreadPool.globalInstance().setMaxThreadCount(POOL_THREADS)
     window = AutoSplitApp()
     window.show()
     sys.exit(app.exec())
@@ -0,0 +1,183 @@
+"""Chapter-splitting helpers shared by auto_split_yt_video.py and gui_split.py."""
+import csv
+import os
+import re
+import subprocess
+from pathlib import Path
+
+VIDEO_EXTS = frozenset({".mp4", ".mkv", ".webm"})
+VIDEO_ID_RE = re.compile(r'(?:v=|youtu\.be/|shorts/)([A-Za-z0-9_-]{11})')
+
+# MP4 layout of the chapter files. "+faststart" is not used: it makes ffmpeg
+# write every chapter twice to move the index to the front.
+#   True  -> fragmented MP4, playable while it streams, written in one pass.
+#   False -> plain MP4 with the index at the end; fine for local playback.
+WEB_STREAMING = False
+
+# Chapters written per ffmpeg process. Keeps the command line under the
+# Windows length limit and bounds the number of open inputs.
+SPLIT_BATCH = 32
+
+# Characters dropped from output file names
+FILENAME_UNSAFE = str.maketrans({c: None for c in ['\\', *'/:*?"<>|', *map(chr, range(32))]})
+# File names are limited to 255 UTF-8 bytes on Linux and 255 UTF-16 units on
+# NTFS. No character takes fewer UTF-8 bytes than UTF-16 units, so a title
+# capped at this many UTF-8 bytes leaves room for "NNN_" and the extension on both.
+TITLE_MAX_BYTES = 200
+
+def clean_filename(text):
+    """Chapter title made safe for use in an output file name."""
+    # Outer spaces are trimmed, inner ones become underscores
+    name = text.translate(FILENAME_UNSAFE).strip().replace(' ', '_')
+    # A multi-byte character cut in half at the limit is dropped
+    return name.encode('utf-8')[:TITLE_MAX_BYTES].decode('utf-8', errors='ignore')
+
+# yt-dlp's default filename sanitization: unsafe characters become their
+# full-width look-alikes, control characters are dropped
+YTDLP_UNSAFE = str.maketrans({
+    **{c: chr(ord(c) + 0xfee0) for c in '"*:<>?|'},
+    '/': '\u29f8', '\\': '\u29f9', '\n': ' ',
+    **{chr(c): None for c in [*range(10), *range(11, 32), 127]},
+})
+TIMESTAMP_RE = re.compile(r'[0-9]+(?::[0-9]+)+')
+
+def ytdlp_filename(title, ext):
+    """File name yt-dlp writes for "-o %(title)s.%(ext)s"."""
+    # Timestamps like 1:30 become 1_30 before the character replacement
+    name = TIMESTAMP_RE.sub(lambda m: m.group(0).replace(':', '_'), title)
+    return f"{name.translate(YTDLP_UNSAFE) or '_'}.{ext}"
+
+def mp4_flags(output):
+    """-movflags for a chapter file; only the MP4 muxer understands them."""
+    if not WEB_STREAMING or Path(output).suffix.lower() != ".mp4":
+        return []
+    return ["-movflags", "+frag_keyframe+empty_moov+default_base_moof"]
+
+def build_split_cmd(video_path, parts):
+    """Build one ffmpeg command that cuts every (start, length, output) in parts.
+
+    Each part gets its own input seeked with -ss before -i, so the copy starts
+    on a keyframe (an output-side -ss would drop B-frame keyframes whose dts
+    precedes the cut). Progress is written to stdout as key=value lines
+    (-progress pipe:1); stderr carries errors only.
+    """
+    cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error", "-nostats", "-progress", "pipe:1"]
+    for start, length, _ in parts:
+        cmd += ["-ss", str(start), "-noaccurate_seek", "-t", str(length), "-i", str(video_path)]
+    cmd += ["-copyts", "-start_at_zero"]
+
+    for n, (_, _, output) in enumerate(parts):
+        # No muxer start delay/preload, so each part's timestamps begin at 0;
+        # make_zero shifts the B-frame lead-in (negative dts) with them
+        cmd += [
+            "-map", f"{n}:v:0", "-map", f"{n}:a?", "-c", "copy",
+            "-muxpreload", "0", "-muxdelay", "0", "-avoid_negative_ts", "make_zero",
+            *mp4_flags(output), str(output)
+        ]
+    return cmd
+
+def build_segment_cmd(video_path, cut_times, end, pattern, list_path):
+    """Build one ffmpeg pass that splits the first end seconds at cut_times.
+
+    Writes numbered files following pattern (e.g. "part_%03d.mp4") and lists
+    them with their real start and end times in list_path (CSV). The segment
+    muxer can only cut on keyframes, so each cut lands on the first keyframe
+    at or after its time.
+    """
+    cmd = [
+        "ffmpeg", "-y", "-hide_banner", "-loglevel", "error", "-nostats", "-progress", "pipe:1",
+        "-t", str(end), "-i", str(video_path),
+        "-map", "0:v:0", "-map", "0:a?", "-c", "copy",
+        "-f", "segment", "-segment_times", ",".join(map(str, cut_times)),
+        "-segment_list", str(list_path), "-segment_list_type", "csv",
+        "-reset_timestamps", "1"
+    ]
+    movflags = mp4_flags(pattern)
+    if movflags:
+        cmd += ["-segment_format_options", f"movflags={movflags[1]}"]
+    return cmd + [pattern]
+
+def chapters_contiguous(parts):
+    """True if each (start, length, output) part ends exactly where the next begins."""
+    return all(length > 0 for _, length, _ in parts) and all(
+        abs(start + length - next_start) < 0.001
+        for (start, length, _), (next_start, _, _) in zip(parts, parts[1:])
+    )
+
+def run_ffmpeg(cmd, on_time=None):
+    """Run an ffmpeg command built with -progress pipe:1.
+
+    on_time, if given, is called with the seconds written so far. Raises with
+    ffmpeg's last error line if it fails.
+    """
+    # Errors share the progress pipe: one reader, nothing can fill up and block
+    process = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        text=True, encoding='utf-8', errors='replace', bufsize=1
+    )
+    errors = []
+    for line in process.stdout:
+        key, sep, value = line.partition("=")
+        if key == "out_time_us":
+            value = value.strip()
+            if on_time and value.isdigit():
+                on_time(int(value) / 1e6)
+        elif not sep or " " in key:
+            errors.append(line.strip())
+    if process.wait() != 0:
+        raise Exception(f"ffmpeg failed: {errors[-1] if errors else process.returncode}")
+
+# Name prefix of the numbered files the segment muxer writes into the output
+# folder before they are renamed to chapters
+SEGMENT_PREFIX = ".segment_"
+
+def segment_files(folder):
+    """Paths of segment-muxer files in folder, leftovers included."""
+    with os.scandir(folder) as it:
+        return [e.path for e in it if e.name.startswith(SEGMENT_PREFIX) and e.is_file()]
+
+def clear_segments(folder):
+    for path in segment_files(folder):
+        os.remove(path)
+
+def split_segments(video_path, parts, on_time=None):
+    """Cut contiguous chapters in a single read of the video (segment muxer).
+
+    Each chapter starts on the first keyframe at or after its start time, later
+    than the seeked cuts of build_split_cmd would place it. Raises if a cut
+    lands at or past the next chapter's start, so the caller can fall back to
+    seeked cuts. All outputs in parts must share one folder. on_time is passed
+    to run_ffmpeg.
+    """
+    first = parts[0][0]
+    end = parts[-1][0] + parts[-1][1]
+    cut_times = [start for start, _, _ in parts[1:]]
+    # Anything before the first chapter becomes segment 0 and is thrown away
+    offset = 1 if first > 0 else 0
+    if offset:
+        cut_times.insert(0, first)
+
+    folder = str(Path(parts[0][2]).parent)
+    # "%" is special to both ffmpeg and Python here, so escape it in the folder name
+    pattern = os.path.join(folder.replace("%", "%%"), f"{SEGMENT_PREFIX}%03d{Path(parts[0][2]).suffix}")
+    # Shares the prefix, so clear_segments removes it with the segments
+    list_path = os.path.join(folder, f"{SEGMENT_PREFIX}list.csv")
+    # Files left by an aborted run would otherwise be renamed as chapters
+    clear_segments(folder)
+    try:
+        run_ffmpeg(build_segment_cmd(video_path, cut_times, end, pattern, list_path), on_time)
+        # Rows are "file,start,end" with the segment's real (keyframe) times
+        with open(list_path, newline='', encoding='utf-8') as f:
+            starts = [float(row[1]) for row in csv.reader(f) if row]
+        if len(starts) != len(parts) + offset:
+            raise Exception(f"segment muxer wrote {len(starts)} files for {len(parts) + offset} cuts")
+        # Cuts that share a keyframe interval all land on the same keyframe,
+        # leaving chapters empty or holding the next chapter's content
+        for n, limit in enumerate(cut_times[offset:] + [end]):
+            if starts[n + offset] >= limit:
+                raise Exception(f"no keyframe inside chapter {n + 1}")
+        for n, (_, _, output) in enumerate(parts):
+            os.replace(pattern % (n + offset), output)
+    finally:
+        # Also removes the unused lead-in segment and any partial output
+        clear_segments(folder)